@@ -39,6 +39,8 @@ def _hide_password(resource):
     :param resource: string with url or file path
     :return: resource with hidden password if present
     """
+    if "@" not in resource:  # Fast path, no credentials, no need to parse it
+        return resource
     password = urlparse(resource).password
     return resource.replace(password, "<hidden>") if password else resource
 
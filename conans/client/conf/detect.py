@@ -1,12 +1,21 @@
+from functools import lru_cache
+
 from conan.api.output import ConanOutput
-from conan.internal.api.detect_api import detect_os, detect_arch, default_msvc_runtime, \
-    detect_libcxx, detect_cppstd, detect_compiler, default_compiler_version
 
 
+@lru_cache(maxsize=1)
 def detect_defaults_settings():
     """ try to deduce current machine values without any constraints at all
-    :return: A list with default settings
+    The probing (compiler executables, vswhere...) is expensive, so it is computed only once per
+    process, use ``detect_defaults_settings.cache_clear()`` to force a new detection. A cached
+    result does not output again the "No compiler was detected" warning or the compiler detection
+    messages
+    :return: A tuple with default settings (name, value) pairs
     """
+    # Imported lazily, importing this module should not pay the detection machinery
+    from conan.internal.api.detect_api import detect_os, detect_arch, default_msvc_runtime, \
+        detect_libcxx, detect_cppstd, detect_compiler, default_compiler_version
+
     result = []
     the_os = detect_os()
     result.append(("os", the_os))
@@ -18,7 +27,7 @@ def detect_defaults_settings():
     if not compiler:
         result.append(("build_type", "Release"))
         ConanOutput().warning("No compiler was detected (one may not be needed)")
-        return result
+        return tuple(result)
 
     result.append(("compiler", compiler))
     result.append(("compiler.version", default_compiler_version(compiler, version)))
@@ -35,4 +44,4 @@ def detect_defaults_settings():
     if cppstd:
         result.append(("compiler.cppstd", cppstd))
     result.append(("build_type", "Release"))
-    return result
+    return tuple(result)
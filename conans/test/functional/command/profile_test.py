@@ -79,6 +79,11 @@ class TestProfile(unittest.TestCase):
 
 
 class DetectCompilersTest(unittest.TestCase):
+    def setUp(self):
+        detect_defaults_settings.cache_clear()
+        # Do not leak the mocked detection to other tests
+        self.addCleanup(detect_defaults_settings.cache_clear)
+
     def test_detect_default_compilers(self):
         platform_default_compilers = {
             "Linux": "gcc",
@@ -146,6 +151,7 @@ class DetectCompilersTest(unittest.TestCase):
             output = RedirectedTestOutput()
             with redirect_output(output):
                 with environment_update({"CC": var, "PATH": cl_location}):
+                    detect_defaults_settings.cache_clear()
                     c.run("profile detect --name=./cl-profile --force")
 
             profile = c.load("cl-profile")
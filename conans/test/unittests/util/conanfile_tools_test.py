@@ -60,8 +60,7 @@ class Pkg(ConanFile):
         text_file = os.path.join(tmp_dir, "text.txt")
         save(text_file, "ONE TWO THREE")
 
-        os.chmod(text_file,
-                 os.stat(text_file).st_mode & ~(stat.S_IWRITE | stat.S_IWGRP | stat.S_IWOTH))
+        os.chmod(text_file, stat.S_IREAD | stat.S_IRGRP | stat.S_IROTH)
 
         with self.assertRaises(PermissionError):
             replace_in_file(ConanFileMock(), text_file, "ONE TWO THREE", "FOUR FIVE SIX")
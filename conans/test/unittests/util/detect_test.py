@@ -12,6 +12,11 @@ from conans.util.env import environment_update
 
 
 class DetectTest(unittest.TestCase):
+    def setUp(self):
+        detect_defaults_settings.cache_clear()
+        # Do not leak the mocked detection to other tests
+        self.addCleanup(detect_defaults_settings.cache_clear)
+
     @mock.patch("platform.machine", return_value="")
     def test_detect_empty_arch(self, _):
         result = detect_defaults_settings()
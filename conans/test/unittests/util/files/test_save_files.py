@@ -0,0 +1,19 @@
+import os
+
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, save_files
+
+
+def test_save_files_nested_folders():
+    folder = temp_folder()
+    save_files(folder, {"file.txt": "root",
+                        "sub/file.txt": "sub",
+                        "sub/sub2/file.txt": "sub2",
+                        "sub/.git/hooks/before_push": "before_push",
+                        "crlf.txt": "line1\r\nline2\n"})
+    assert load(os.path.join(folder, "file.txt")) == "root"
+    assert load(os.path.join(folder, "sub", "file.txt")) == "sub"
+    assert load(os.path.join(folder, "sub", "sub2", "file.txt")) == "sub2"
+    assert load(os.path.join(folder, "sub", ".git", "hooks", "before_push")) == "before_push"
+    # newlines are not translated, same as save()
+    assert load(os.path.join(folder, "crlf.txt")) == "line1\r\nline2\n"
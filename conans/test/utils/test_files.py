@@ -85,14 +85,19 @@ def tgz_with_contents(files, output_path=None):
     file_path = output_path or os.path.join(folder, "myfile.tar.gz")
 
     with open(file_path, "wb") as tgz_handle:
-        tgz = gzopen_without_timestamps("myfile.tar.gz", mode="w", fileobj=tgz_handle)
+        write_tgz_with_contents(files, tgz_handle)
 
-        for name, content in files.items():
-            info = tarfile.TarInfo(name=name)
-            data = content.encode('utf-8')
-            info.size = len(data)
-            tgz.addfile(tarinfo=info, fileobj=BytesIO(data))
+    return file_path
 
-        tgz.close()
 
-    return file_path
+def write_tgz_with_contents(files, fileobj, compresslevel=None):
+    tgz = gzopen_without_timestamps("myfile.tar.gz", mode="w", fileobj=fileobj,
+                                    compresslevel=compresslevel)
+
+    for name, content in files.items():
+        info = tarfile.TarInfo(name=name)
+        data = content.encode('utf-8')
+        info.size = len(data)
+        tgz.addfile(tarinfo=info, fileobj=BytesIO(data))
+
+    tgz.close()
@@ -951,8 +951,8 @@ class StoppableThreadBottle(threading.Thread):
         time.sleep(1)
 
 
-def zipdir(path, zipfilename):
-    with zipfile.ZipFile(zipfilename, 'w', zipfile.ZIP_DEFLATED) as z:
+def zipdir(path, zipfilename, compression=zipfile.ZIP_DEFLATED):
+    with zipfile.ZipFile(zipfilename, 'w', compression) as z:
         for root, _, files in os.walk(path):
             for f in files:
                 file_path = os.path.join(root, f)
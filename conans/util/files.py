@@ -121,8 +121,14 @@ def save(path, content, encoding="utf-8"):
 
 
 def save_files(path, files, encoding="utf-8"):
+    # Create every parent folder just once, instead of once per saved file
+    folders = {os.path.dirname(os.path.join(path, name)) for name in files}
+    for folder in folders:
+        if folder:
+            os.makedirs(folder, exist_ok=True)
     for name, content in files.items():
-        save(os.path.join(path, name), content, encoding=encoding)
+        with open(os.path.join(path, name), "w", encoding=encoding, newline="") as handle:
+            handle.write(content)
 
 
 def load(path, encoding="utf-8"):